@@ -1,61 +1,166 @@
-from .listener import Listener
+from .listener import Listener, RequestListener
 from .mega import MegaApi
-import asyncio, inspect, logging, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import ast, asyncio, logging, pathlib
 
+logger = logging.getLogger(__name__)
+
+# mega.py is SWIG-generated and sits next to this module; parse it once at
+# import time to find every method that takes a listener argument, instead of
+# introspecting signatures at runtime.
+_LISTENER_METHODS = frozenset(
+    node.name
+    for node in ast.walk(
+        ast.parse(pathlib.Path(__file__).with_name("mega.py").read_text())
+    )
+    if isinstance(node, ast.FunctionDef)
+    and any(a.arg == "listener" for a in node.args.args + node.args.kwonlyargs)
+)
+
+
+# Define an async wrapper class for MegaApi. Not a MegaApi subclass: inherited
+# method names would shadow __getattr__, which only fires on misses.
+class AsyncMegaApi:
+    # __dict__ stays in the slots so __getattr__ can still lazily bind
+    # wrapped methods onto the instance.
+    __slots__ = (
+        "__api",
+        "__loop",
+        "__listener",
+        "__email",
+        "__password",
+        "__executor",
+        "__pending",
+        "__listener_pool",
+        "__dict__",
+    )
 
-# Define an async wrapper class for MegaApi
-class AsyncMegaApi(MegaApi):
     def __init__(
         self, appkey: str = "UNSUPPORTED", email: str = None, password: str = None
     ):
         self.__api = MegaApi(appkey, None, None, "Python Async Wrapper")
-        self.__loop = asyncio.get_event_loop()
+        # Captured from the running loop on first await; get_event_loop() here
+        # could bind a different loop than the one asyncio.run() creates.
+        self.__loop = None
+        self.__listener = None
+        self.__pending = set()
+        self.__listener_pool = deque()
         self.__email = email
         self.__password = password
+        # MegaApi methods only enqueue work and signal completion through the
+        # listener, so a small pool of reusable threads is plenty. Pool size
+        # has no correctness impact: each call carries its own
+        # RequestListener, so completions are routed per request and never
+        # depend on the order workers enter the native call.
+        self.__executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mega")
 
-    def __get_target_method(self, name):
-        """Retrieve the attribute from the MegaApi instance using super to avoid recursion."""
-        target = self.__api
-        method = getattr(target, name, None)
-        if not method:
-            raise AttributeError(f"{name} does not exist")
-        return method
-
-    async def __wrap_target_with_listener(self, name, target, *args):
-        """Define an async function to manage listeners and threading."""
-        logging.info(f"Beginning ({name})")
-        future = asyncio.Future()
-        listener = Listener(self.__loop, future)
-        self.__api.addListener(listener)
-        threading.Thread(target=target, args=args).start()
-
-        try:
-            result = await future
-        except Exception as e:
-            self.__api.removeListener(listener)
-            raise future._exception
-        self.__api.removeListener(listener)
-        logging.info(f"Ending ({name})")
+    async def __wrap_target_with_listener(self, name, target, *args, copy=True):
+        """Define an async function to manage listeners and threading.
+
+        With copy=True (the default) the awaited value is a full native copy
+        of the finished request; copy=False skips the C++ deep copy and
+        resolves to a lightweight RequestResult instead.
+        """
+        logger.info("Beginning (%s)", name)
+        if self.__loop is None:
+            self.__loop = asyncio.get_running_loop()
+        if self.__listener is None:
+            # One global listener for the lifetime of this wrapper; it only
+            # logs events and tracks the root node.
+            self.__listener = Listener()
+            self.__api.addListener(self.__listener)
+        future = self.__loop.create_future()
+        if self.__listener_pool:
+            # Reuse a released listener; the director allocation is the
+            # expensive part of a RequestListener.
+            listener = self.__listener_pool.popleft()
+            listener.reset(future, copy)
+        else:
+            listener = RequestListener(
+                self.__loop, future, copy, release=self.__release_listener
+            )
+        # Hold a strong reference for the life of the native request: if the
+        # caller cancels the await, the coroutine frame unwinds, but MegaApi
+        # still holds the director pointer and freeing the listener would be
+        # a use-after-free on the next callback.
+        self.__pending.add(listener)
+        # Fire the native call on the pooled executor through the loop so the
+        # submission future is loop-aware. The per-request listener rides in
+        # as the listener argument, so MegaApi routes this request's
+        # callbacks straight to it — completions cannot be matched to the
+        # wrong caller no matter how concurrent submissions interleave.
+        submission = self.__loop.run_in_executor(self.__executor, target, *args, listener)
+        submission.add_done_callback(lambda s: self.__on_submitted(s, future, listener))
+
+        result = await future
+        logger.info("Ending (%s)", name)
         return result
 
-    def __getattribute__(self, name):
-        # If accessing internal attributes or methods, use super to avoid recursion
-        if name.startswith("_{}__".format(type(self).__name__)):
-            return super().__getattribute__(name)
+    def __on_submitted(self, submission, future, listener):
+        """Surface a failure from the native call itself on the awaited future.
 
-        target = self.__get_target_method(name)
-        if callable(target) and "listener" in inspect.signature(target).parameters:
+        If target() raised before MegaApi accepted the request (e.g. a
+        TypeError from wrong arguments), no listener callback will ever
+        resolve the future; without this the await would hang forever. The
+        listener is dropped from the pending set here, since a call that
+        raised never handed its pointer to MegaApi.
+        """
+        if submission.cancelled():
+            if not future.done():
+                future.cancel()
+            return
+        exc = submission.exception()
+        if exc is not None:
+            self.__pending.discard(listener)
+            if not future.done():
+                future.set_exception(exc)
+
+    def __release_listener(self, listener):
+        """Return a listener whose request has terminally finished to the pool.
+
+        Invoked on the loop thread from the listener's completion callback —
+        only once MegaApi is done with it, never on mere cancellation of the
+        await — so a pooled listener can never be rearmed while a stale
+        resolution is still queued.
+        """
+        if listener in self.__pending:
+            self.__pending.remove(listener)
+            self.__listener_pool.append(listener)
+
+    def __getattr__(self, name):
+        # Only missing attributes land here; anything bound below is served
+        # straight from the instance dict on later accesses.
+        if name.startswith("_"):
+            raise AttributeError(f"{name} does not exist")
+
+        target = getattr(self.__api, name, None)
+        if target is None:
+            raise AttributeError(f"{name} does not exist")
 
-            async def wrapper(*args):
-                return await self.__wrap_target_with_listener(name, target, *args)
+        attr = target
+        if name in _LISTENER_METHODS:
+            # Bind a new name for the wrapper: reassigning target here would
+            # rebind the variable the closure itself captures.
+            async def wrapper(*args, copy=True):
+                return await self.__wrap_target_with_listener(
+                    name, target, *args, copy=copy
+                )
 
-            return wrapper
-        return target
+            attr = wrapper
+        if callable(attr):
+            object.__setattr__(self, name, attr)
+        return attr
 
     async def __aenter__(self):
+        self.__loop = asyncio.get_running_loop()
         await self.login(self.__email, self.__password)
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.logout()
+        if self.__listener is not None:
+            self.__api.removeListener(self.__listener)
+            self.__listener = None
+        self.__executor.shutdown(wait=False)
         return True
@@ -3,6 +3,7 @@ from .mega import (
     MegaContactRequestList,
     MegaListener,
     MegaRequest,
+    MegaRequestListener,
     MegaError,
     MegaEvent,
     MegaNodeList,
@@ -14,7 +15,15 @@ from .mega import (
     MegaUserAlertList,
     MegaUserList,
 )
-import asyncio, logging
+import asyncio, logging, threading, time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between logged progress updates (~10/sec); MegaApi can
+# fire update callbacks for every chunk of a large transfer.
+_UPDATE_LOG_INTERVAL = 0.1
+
 
 class AiomegaError(Exception):
     """Base exception for aiomega module."""
@@ -25,6 +34,255 @@ class MegaApiError(AiomegaError):
     pass
 
 
+@dataclass(slots=True)
+class RequestResult:
+    """
+    Lightweight snapshot of a finished MegaRequest.
+
+    Returned in place of a full native request copy when a wrapped call is
+    made with ``copy=False``, avoiding the C++ deep copy for callers that
+    only need the scalar fields.
+
+    Attributes
+    ----------
+    type : int
+        The MegaRequest type code.
+    tag : int
+        The tag identifying the request.
+    """
+
+    type: int
+    tag: int
+
+
+class RequestListener(MegaRequestListener):
+    """
+    A per-request listener that resolves an asyncio future on completion.
+
+    Passed as the listener argument of a MegaApi call, so MegaApi itself
+    routes the callbacks for exactly that request (and any request this
+    listener chains, such as the fetchNodes following a login) here.
+    Completions can therefore never be matched to the wrong caller, no
+    matter how concurrent submissions interleave.
+
+    Attributes
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop in which asynchronous operations will be performed.
+    future : asyncio.Future
+        The future resolved with the request result or error.
+    copy : bool
+        Whether the future resolves to a full native copy of the request
+        (True) or a lightweight RequestResult (False).
+    root_node : object
+        The root node recorded by a chained fetchNodes request; initially
+        None.
+    """
+
+    __slots__ = (
+        "loop",
+        "future",
+        "copy",
+        "root_node",
+        "_loop_thread_ident",
+        "_last_request_log",
+        "_release",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        future: asyncio.Future,
+        copy: bool = True,
+        release=None,
+    ):
+        """
+        Initialize RequestListener.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            Event loop for asynchronous operations.
+        future : asyncio.Future
+            Future object to hold the result of the request.
+        copy : bool
+            When True the future resolves to a full native copy of the
+            request; when False to a lightweight RequestResult.
+        release : callable, optional
+            Called with this listener on the loop thread once the request
+            has terminally finished and the listener is safe to drop.
+        """
+        self.loop = loop
+        self.future = future
+        self.copy = copy
+        self.root_node = None
+        self._last_request_log = 0.0
+        self._release = release
+        # Listeners are constructed on the event-loop thread; remember it so
+        # callbacks can skip the threadsafe wakeup when MegaApi happens to
+        # deliver them on that same thread.
+        self._loop_thread_ident = threading.get_ident()
+        super(RequestListener, self).__init__()
+
+    def reset(self, future: asyncio.Future, copy: bool = True):
+        """
+        Rearm a pooled listener for a new request.
+
+        Only safe after the release hook has run for the previous request,
+        i.e. once its future resolution executed on the loop thread.
+
+        Parameters
+        ----------
+        future : asyncio.Future
+            Future object to hold the result of the request.
+        copy : bool
+            When True the future resolves to a full native copy of the
+            request; when False to a lightweight RequestResult.
+        """
+        self.future = future
+        self.copy = copy
+        self.root_node = None
+        self._last_request_log = 0.0
+
+    def _schedule(self, callback, *args):
+        """
+        Schedule a callback on the event loop from whichever thread fired.
+
+        Parameters
+        ----------
+        callback : callable
+            The callback to run on the event loop.
+        *args
+            Arguments passed through to the callback.
+        """
+        if threading.get_ident() == self._loop_thread_ident:
+            self.loop.call_soon(callback, *args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def onRequestStart(self, api: MegaApi, request: MegaRequest):
+        """
+        Log request start events.
+
+        Parameters
+        ----------
+        api : MegaApi
+            The associated MegaApi instance.
+        request : MegaRequest
+            The request being started.
+        """
+        logger.info("onRequestStart %s", request)
+
+    def onRequestFinish(self, api: MegaApi, request: MegaRequest, error: MegaError):
+        """
+        Handle and log request finish events.
+
+        Parameters
+        ----------
+        api : MegaApi
+            The associated MegaApi instance.
+        request : MegaRequest
+            The request being finished.
+        error : MegaError
+            Any error associated with the request.
+        """
+        if error.getErrorCode() != MegaError.API_OK:
+            logger.error("onRequestFinish %s %s", request, error)
+            self._schedule(self._complete, None, MegaApiError(error.copy()))
+            return
+
+        logger.info("onRequestFinish %s", request)
+        handler = self._FINISH_HANDLERS.get(request.getType())
+        if handler is not None and handler(self, api, request):
+            return
+        result = (
+            request.copy()
+            if self.copy
+            else RequestResult(request.getType(), request.getTag())
+        )
+        self._schedule(self._complete, result, None)
+
+    def _complete(self, result, exception):
+        """
+        Resolve the future on the loop thread, dropping late completions.
+
+        The caller may have cancelled the await (e.g. a timeout) before
+        MegaApi finished the request; the future is then already done and
+        setting it again would raise InvalidStateError inside the loop.
+
+        Running here — after the terminal callback, on the loop thread —
+        also makes this the one safe place to hand the listener back to its
+        owner: MegaApi is done with it and the future can no longer change.
+        """
+        if not self.future.done():
+            if exception is not None:
+                self.future.set_exception(exception)
+            else:
+                self.future.set_result(result)
+        if self._release is not None:
+            self._release(self)
+
+    def _finish_login(self, api: MegaApi, request: MegaRequest):
+        """
+        Handle a finished login request.
+
+        Returns True when the chained fetchNodes request was started on this
+        same listener and the future must not be resolved yet.
+        """
+        if not self.root_node:
+            # The login call only completes once the node tree is in; chain
+            # fetchNodes onto this listener so it resolves the same future.
+            api.fetchNodes(self)
+            return True
+        return False
+
+    def _finish_fetch_nodes(self, api: MegaApi, request: MegaRequest):
+        """Record the root node once the node tree has been fetched."""
+        self.root_node = api.getRootNode()
+        return False
+
+    # Hashed dispatch for the request types that need special handling;
+    # everything else resolves the future directly in onRequestFinish.
+    _FINISH_HANDLERS = {
+        MegaRequest.TYPE_LOGIN: _finish_login,
+        MegaRequest.TYPE_FETCH_NODES: _finish_fetch_nodes,
+    }
+
+    def onRequestUpdate(self, api: MegaApi, request: MegaRequest):
+        """
+        Logs the progress of a request.
+
+        Parameters
+        ----------
+        api : MegaApi
+            The associated MegaApi instance.
+        request : MegaRequest
+            The request being updated.
+        """
+        now = time.monotonic()
+        if now - self._last_request_log < _UPDATE_LOG_INTERVAL:
+            return
+        self._last_request_log = now
+        logger.debug("onRequestUpdate %s", request)
+
+    def onRequestTemporaryError(
+        self, api: MegaApi, request: MegaRequest, error: MegaError
+    ):
+        """
+        Logs temporary errors related to a request.
+
+        Parameters
+        ----------
+        api : MegaApi
+            The associated MegaApi instance.
+        request : MegaRequest
+            The request with a temporary error.
+        error : MegaError
+            The associated error details.
+        """
+        logger.error("onRequestTemporaryError %s %s", request, error)
+
+
 class Listener(MegaListener):
     """
     A subclass of MegaListener designed to handle MegaApi events asynchronously.
@@ -34,10 +292,6 @@ class Listener(MegaListener):
 
     Attributes
     ----------
-    loop : asyncio.AbstractEventLoop
-        The event loop in which asynchronous operations will be performed.
-    future : asyncio.Future
-        A future object that represents a potential result from an asynchronous operation.
     root_node : object
         Represents the root node in the user's MEGA account file system hierarchy.
         It's initially None and gets assigned after successful fetch operation.
@@ -92,20 +346,13 @@ class Listener(MegaListener):
         Logs other events.
     """
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future):
-        """
-        Initialize Listener.
+    __slots__ = ("root_node", "_last_transfer_log", "_last_request_log")
 
-        Parameters
-        ----------
-        loop : asyncio.AbstractEventLoop
-            Event loop for asynchronous operations.
-        future : asyncio.Future
-            Future object to hold results of async operations.
-        """
-        self.loop = loop
-        self.future = future
+    def __init__(self):
+        """Initialize Listener."""
         self.root_node = None
+        self._last_transfer_log = 0.0
+        self._last_request_log = 0.0
         super(Listener, self).__init__()
 
     def onRequestStart(self, api: MegaApi, request: MegaRequest):
@@ -119,11 +366,14 @@ class Listener(MegaListener):
         request : MegaRequest
             The request being started.
         """
-        logging.info(("onRequestStart", str(request)))
+        logger.info("onRequestStart %s", request)
 
     def onRequestFinish(self, api: MegaApi, request: MegaRequest, error: MegaError):
         """
-        Handle and log request finish events.
+        Log request finish events.
+
+        Future resolution happens on the per-request RequestListener; this
+        global listener only logs and keeps root_node current.
 
         Parameters
         ----------
@@ -135,21 +385,11 @@ class Listener(MegaListener):
             Any error associated with the request.
         """
         if error.getErrorCode() != MegaError.API_OK:
-            logging.error(("onRequestFinish", str(request), str(error)))
-            self.loop.call_soon_threadsafe(
-                self.future.set_exception, MegaApiError(error.copy())
-            )
+            logger.error("onRequestFinish %s %s", request, error)
             return
-
-        logging.info(("onRequestFinish", str(request)))
-        match request.getType():
-            case MegaRequest.TYPE_LOGIN:
-                if not self.root_node:
-                    api.fetchNodes()
-            case MegaRequest.TYPE_FETCH_NODES:
-                self.root_node = api.getRootNode()
-            case _:
-                self.loop.call_soon_threadsafe(self.future.set_result, request.copy())
+        logger.info("onRequestFinish %s", request)
+        if request.getType() == MegaRequest.TYPE_FETCH_NODES:
+            self.root_node = api.getRootNode()
 
     def onRequestUpdate(self, api: MegaApi, request: MegaRequest):
         """
@@ -162,7 +402,11 @@ class Listener(MegaListener):
         request : MegaRequest
             The request being updated.
         """
-        logging.debug(("onRequestUpdate", str(request)))
+        now = time.monotonic()
+        if now - self._last_request_log < _UPDATE_LOG_INTERVAL:
+            return
+        self._last_request_log = now
+        logger.debug("onRequestUpdate %s", request)
 
     def onRequestTemporaryError(
         self, api: MegaApi, request: MegaRequest, error: MegaError
@@ -179,7 +423,7 @@ class Listener(MegaListener):
         error : MegaError
             The associated error details.
         """
-        logging.error(("onRequestTemporaryError", str(request), str(error)))
+        logger.error("onRequestTemporaryError %s %s", request, error)
 
     def onTransferStart(self, api: MegaApi, transfer: MegaTransfer):
         """
@@ -192,7 +436,7 @@ class Listener(MegaListener):
         transfer : MegaTransfer
             The transfer being initiated.
         """
-        logging.info(("onTransferStart", str(transfer), transfer.getFileName()))
+        logger.info("onTransferStart %s %s", transfer, transfer.getFileName())
 
     def onTransferFinish(self, api: MegaApi, transfer: MegaTransfer, error: MegaError):
         """
@@ -207,8 +451,8 @@ class Listener(MegaListener):
         error : MegaError
             Any error associated with the transfer.
         """
-        logging.info(
-            ("onTransferFinish", str(transfer), transfer.getFileName(), str(error))
+        logger.info(
+            "onTransferFinish %s %s %s", transfer, transfer.getFileName(), error
         )
         # self.continue_event.set()
 
@@ -223,15 +467,21 @@ class Listener(MegaListener):
         transfer : MegaTransfer
             The transfer being updated.
         """
-        logging.debug(
-            (
-                "onTransferUpdate",
-                transfer,
-                transfer.getFileName(),
-                transfer.getTransferredBytes() / 1024,
-                transfer.getTotalBytes() / 1024,
-                transfer.getSpeed() / 1024,
-            )
+        now = time.monotonic()
+        if now - self._last_transfer_log < _UPDATE_LOG_INTERVAL:
+            return
+        self._last_transfer_log = now
+        # Guard explicitly: the getter calls cross the SWIG boundary on every
+        # chunk, so skip them entirely when DEBUG is filtered out.
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "onTransferUpdate %s %s %.1f/%.1f KiB @ %.1f KiB/s",
+            transfer,
+            transfer.getFileName(),
+            transfer.getTransferredBytes() / 1024,
+            transfer.getTotalBytes() / 1024,
+            transfer.getSpeed() / 1024,
         )
 
     def onTransferTemporaryError(
@@ -249,13 +499,8 @@ class Listener(MegaListener):
         error : MegaError
             The associated error details.
         """
-        logging.error(
-            (
-                "onTransferTemporaryError",
-                str(transfer),
-                transfer.getFileName(),
-                str(error),
-            )
+        logger.error(
+            "onTransferTemporaryError %s %s %s", transfer, transfer.getFileName(), error
         )
 
     def onUsersUpdate(self, api: MegaApi, users: MegaUserList):
@@ -269,8 +514,8 @@ class Listener(MegaListener):
         users : MegaUserList
             Updated list of users.
         """
-        if users != None:
-            logging.debug(("onUsersUpdate", users.size()))
+        if users is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onUsersUpdate %d", users.size())
 
     def onUserAlertsUpdate(self, api: MegaApi, alerts: MegaUserAlertList):
         """
@@ -283,8 +528,8 @@ class Listener(MegaListener):
         alerts : MegaUserAlertList
             Updated list of user alerts.
         """
-        if alerts != None:
-            logging.debug(("onUserAlertsUpdate", alerts.size()))
+        if alerts is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onUserAlertsUpdate %d", alerts.size())
 
     def onNodesUpdate(self, api: MegaApi, nodes: MegaNodeList):
         """
@@ -297,8 +542,8 @@ class Listener(MegaListener):
         nodes : MegaNodeList
             Updated list of nodes.
         """
-        if nodes != None:
-            logging.debug(("onNodesUpdate", nodes.size()))
+        if nodes is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onNodesUpdate %d", nodes.size())
 
     def onAccountUpdate(self, api: MegaApi):
         """
@@ -309,7 +554,7 @@ class Listener(MegaListener):
         api : MegaApi
             The associated MegaApi instance.
         """
-        logging.debug(("onAccountUpdate",))
+        logger.debug("onAccountUpdate")
 
     def onSetsUpdate(self, api: MegaApi, sets: MegaSetList):
         """
@@ -322,8 +567,8 @@ class Listener(MegaListener):
         sets : MegaSetList
             Updated list of sets.
         """
-        if sets != None:
-            logging.debug(("onSetsUpdate", sets.size()))
+        if sets is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onSetsUpdate %d", sets.size())
 
     def onSetElementsUpdate(self, api: MegaApi, elements: MegaSetElementList):
         """
@@ -336,8 +581,8 @@ class Listener(MegaListener):
         elements : MegaSetElementList
             Updated list of set elements.
         """
-        if elements != None:
-            logging.debug(("onSetElementsUpdate", elements.size()))
+        if elements is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onSetElementsUpdate %d", elements.size())
 
     def onContactRequestsUpdate(self, api: MegaApi, requests: MegaContactRequestList):
         """
@@ -350,8 +595,8 @@ class Listener(MegaListener):
         requests : MegaContactRequestList
             Updated list of contact requests.
         """
-        if requests != None:
-            logging.debug(("onContactRequestsUpdate", requests.size()))
+        if requests is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onContactRequestsUpdate %d", requests.size())
 
     def onReloadNeeded(self, api: MegaApi):
         """
@@ -362,7 +607,7 @@ class Listener(MegaListener):
         api : MegaApi
             The associated MegaApi instance.
         """
-        logging.debug(("onReloadNeeded",))
+        logger.debug("onReloadNeeded")
 
     def onBackupStateChanged(self, api: MegaApi, backup: MegaScheduledCopy):
         """
@@ -375,7 +620,7 @@ class Listener(MegaListener):
         backup : MegaScheduledCopy
             The backup whose state has changed.
         """
-        logging.debug(("onBackupStateChanged",))
+        logger.debug("onBackupStateChanged")
 
     def onBackupStart(self, api: MegaApi, backup: MegaScheduledCopy):
         """
@@ -388,7 +633,7 @@ class Listener(MegaListener):
         backup : MegaScheduledCopy
             The backup that has started.
         """
-        logging.info(("onBackupStart",))
+        logger.info("onBackupStart")
 
     def onBackupFinish(self, api: MegaApi, backup: MegaScheduledCopy, error: MegaError):
         """
@@ -403,10 +648,10 @@ class Listener(MegaListener):
         error : MegaError
             Any error associated with the backup.
         """
-        if error != None:
-            logging.error(("onBackupFinish", error))
+        if error is not None:
+            logger.error("onBackupFinish %s", error)
         else:
-            logging.info(("onBackupFinish",))
+            logger.info("onBackupFinish")
 
     def onBackupUpdate(self, api: MegaApi, backup: MegaScheduledCopy):
         """
@@ -419,7 +664,7 @@ class Listener(MegaListener):
         backup : MegaScheduledCopy
             The backup being updated.
         """
-        logging.debug(("onBackupUpdate",))
+        logger.debug("onBackupUpdate")
 
     def onBackupTemporaryError(
         self, api: MegaApi, backup: MegaScheduledCopy, error: MegaError
@@ -436,7 +681,7 @@ class Listener(MegaListener):
         error : MegaError
             The associated error details.
         """
-        logging.error(("onBackupTemporaryError", error))
+        logger.error("onBackupTemporaryError %s", error)
 
     def onChatUpdate(self, api: MegaApi, chats: MegaTextChatList):
         """
@@ -449,8 +694,8 @@ class Listener(MegaListener):
         chats : MegaTextChatList
             Updated list of chats.
         """
-        if chats != None:
-            logging.debug(("onChatUpdate", chats.size()))
+        if chats is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onChatUpdate %d", chats.size())
 
     def onEvent(self, api: MegaApi, event: MegaEvent):
         """
@@ -463,4 +708,5 @@ class Listener(MegaListener):
         event : MegaEvent
             The event being logged.
         """
-        logging.debug(("onEvent", event.getEventString(), event.getText()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("onEvent %s %s", event.getEventString(), event.getText())
@@ -2,6 +2,13 @@ from aiomega import AsyncMegaApi, MegaAccountDetails
 from dotenv import load_dotenv
 import asyncio, os, logging
 
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 load_dotenv()
 
 logging.basicConfig(
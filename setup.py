@@ -40,6 +40,9 @@ setup(
     include_package_data=True,
     python_requires=">=3.10, <4",
     install_requires=[],
+    extras_require={
+        "fast": ["uvloop>=0.19"],
+    },
     project_urls={
         "Bug Reports": "https://github.com/ggpwnkthx/aiomega/issues",
         "Source": "https://github.com/ggpwnkthx/aiomega/",